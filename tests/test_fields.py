@@ -623,6 +623,13 @@ def test_array():
     value, error = validator.validate_or_error(["a", "a"])
     assert dict(error) == {1: "Items must be unique."}
 
+    class Label(str):
+        pass
+
+    validator = Array(unique_items=True)
+    value, error = validator.validate_or_error([Label("a"), "a"])
+    assert dict(error) == {1: "Items must be unique."}
+
     validator = Array(items=[String(), Integer(), Boolean()], min_items=1)
     value, error = validator.validate_or_error(["a"])
     assert value == ["a"]
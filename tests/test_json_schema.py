@@ -5,7 +5,13 @@ import re
 import pytest
 
 import typesystem
-from typesystem.json_schema import JSONSchema, from_json_schema, to_json_schema
+from typesystem.json_schema import (
+    JSONSchema,
+    compile_from_json_schema,
+    from_json_schema,
+    ref_from_json_schema,
+    to_json_schema,
+)
 
 filenames = [
     "additionalItems.json",
@@ -85,6 +91,17 @@ def test_json_schema(schema, data, is_valid, description):
         assert error is not None, description
 
 
+@pytest.mark.parametrize("schema,data,is_valid,description", test_cases)
+def test_compile_from_json_schema(schema, data, is_valid, description):
+    validate = compile_from_json_schema(schema)
+    try:
+        validate(data)
+    except typesystem.ValidationError:
+        assert not is_valid, description
+    else:
+        assert is_valid, description
+
+
 @pytest.mark.parametrize("schema,data,is_valid,description", test_cases)
 def test_json_schema_validator(schema, data, is_valid, description):
     """
@@ -161,6 +178,16 @@ def test_to_json_schema_invalid_field():
     assert str(exc_info.value) == expected
 
 
+class CustomString(typesystem.String):
+    pass
+
+
+def test_to_json_schema_field_subclass():
+    field = CustomString(min_length=2, max_length=10)
+    assert to_json_schema(field) == {"type": "string", "minLength": 2, "maxLength": 10}
+    assert to_json_schema(field) == {"type": "string", "minLength": 2, "maxLength": 10}
+
+
 def test_to_json_schema_complex_regular_expression():
     field = typesystem.String(pattern=re.compile("foo", re.IGNORECASE | re.VERBOSE))
     with pytest.raises(ValueError) as exc_info:
@@ -170,3 +197,276 @@ def test_to_json_schema_complex_regular_expression():
         "Cannot convert regular expression with non-standard flags to JSON schema: "
     )
     assert str(exc_info.value).startswith(expected)
+
+
+def test_compile_from_json_schema_errors():
+    validate = compile_from_json_schema(
+        {
+            "type": "object",
+            "properties": {
+                "name": {"type": ["string", "null"], "minLength": 3},
+                "tags": {"type": "array", "items": {"type": "integer"}},
+            },
+            "required": ["name"],
+            "additionalProperties": False,
+        }
+    )
+
+    value = {"name": "example", "tags": [1, 2, 3]}
+    assert validate(value) is value
+    assert validate({"name": None}) == {"name": None}
+
+    with pytest.raises(typesystem.ValidationError) as exc_info:
+        validate({"tags": []})
+    assert dict(exc_info.value) == {"name": "This field is required."}
+
+    with pytest.raises(typesystem.ValidationError) as exc_info:
+        validate({"name": "ab"})
+    assert dict(exc_info.value) == {"name": "Must have at least 3 characters."}
+
+    with pytest.raises(typesystem.ValidationError) as exc_info:
+        validate({"name": "example", "tags": [1, "2"]})
+    assert dict(exc_info.value) == {"tags": {1: "Must be a number."}}
+
+    with pytest.raises(typesystem.ValidationError) as exc_info:
+        validate({"name": "example", "extra": True})
+    assert dict(exc_info.value) == {"extra": "Invalid property name."}
+
+
+def test_compile_from_json_schema_fallback():
+    validate = compile_from_json_schema(
+        {
+            "components": {"schemas": {"Name": {"type": "string", "format": "date"}}},
+            "type": "array",
+            "items": {"$ref": "#/components/schemas/Name"},
+        }
+    )
+
+    assert validate(["2021-01-01"]) == ["2021-01-01"]
+    with pytest.raises(typesystem.ValidationError) as exc_info:
+        validate(["not a date"])
+    assert dict(exc_info.value) == {0: "Must be a valid date format."}
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"type": "foo"},
+        {"type": "integer", "minimum": "1"},
+        {"type": "string", "maxLength": "x"},
+        {"type": "array", "maxItems": "2"},
+        {"type": "object", "required": [1]},
+    ],
+)
+def test_compile_from_json_schema_invalid_constraints(schema):
+    with pytest.raises(AssertionError):
+        from_json_schema(schema)
+    with pytest.raises(AssertionError):
+        compile_from_json_schema(schema)
+
+
+compiled_cases = [
+    ({"type": "number", "minimum": 1}, [0, 1]),
+    ({"type": "number", "exclusiveMinimum": 1}, [1, 2]),
+    ({"type": "number", "maximum": 1}, [2, 1]),
+    ({"type": "number", "exclusiveMaximum": 1}, [1, 0]),
+    ({"type": "number", "multipleOf": 2}, [3, 4]),
+    ({"type": "number", "multipleOf": 0.5}, [0.7, 1.5]),
+    ({"type": "number"}, [float("inf"), "a", True, None, 1.5]),
+    ({"type": "integer"}, [1.5, 2.0, 2]),
+    ({"type": "string", "minLength": 2}, ["a", "", "ab"]),
+    ({"type": "string", "maxLength": 2}, ["abc", "ab"]),
+    ({"type": "string", "pattern": "^a"}, ["ba", "ab"]),
+    ({"type": "boolean"}, [1, True]),
+    ({"type": "array", "minItems": 1}, [[], [1]]),
+    ({"type": "array", "minItems": 2}, [[1], [1, 2]]),
+    ({"type": "array", "maxItems": 1}, [[1, 2], [1]]),
+    ({"type": "array", "minItems": 2, "maxItems": 2}, [[1], [1, 2, 3], [1, 2]]),
+    ({"type": "object", "minProperties": 1}, [{}, {"a": 1}]),
+    ({"type": "object", "minProperties": 2}, [{"a": 1}, {"a": 1, "b": 2}]),
+    ({"type": "object", "maxProperties": 1}, [{"a": 1, "b": 2}, {}]),
+    ({"type": "object"}, [{1: 2}, []]),
+    (
+        {"type": "object", "additionalProperties": {"type": "integer"}},
+        [{"a": "x"}, {"a": 1}],
+    ),
+    ({"type": ["integer", "null"]}, [None, "a", 1]),
+    ({"type": "null"}, [None, 1]),
+    ({"enum": [1, "a"]}, [2, None, "", 1]),
+    ({"const": None}, [2, None]),
+    ({"type": "number", "maximum": float("inf")}, [1]),
+    ({"type": "number", "minimum": float("-inf")}, [1, "a"]),
+    ({"const": float("inf")}, [1, float("inf")]),
+]
+
+
+@pytest.mark.parametrize("schema,values", compiled_cases)
+def test_compile_from_json_schema_matches_fields(schema, values):
+    """
+    Each generated check should fail with the same first error as the field
+    built by `from_json_schema()`.
+    """
+    validate = compile_from_json_schema(schema)
+    field = from_json_schema(schema)
+    for value in values:
+        _, error = field.validate_or_error(value)
+        try:
+            validate(value)
+        except typesystem.ValidationError as exc:
+            assert error is not None, value
+            assert exc.messages()[0] == error.messages()[0], value
+        else:
+            assert error is None, value
+
+
+def test_from_json_schema_flattens_all_of():
+    field = from_json_schema(
+        {
+            "type": "integer",
+            "allOf": [{"minimum": 1}, {"allOf": [{"maximum": 10}, {"multipleOf": 2}]}],
+        }
+    )
+
+    assert isinstance(field, typesystem.composites.AllOf)
+    assert not any(
+        isinstance(child, typesystem.composites.AllOf) for child in field.all_of
+    )
+    assert len(field.all_of) == 4
+    assert field.validate_or_error(4)
+    assert not field.validate_or_error(12)
+    assert not field.validate_or_error(3)
+
+
+def test_from_json_schema_union_ordering():
+    field = from_json_schema({"type": ["string", "null", "integer", "boolean"]})
+    assert isinstance(field, typesystem.Union)
+    assert field.allow_null
+    assert [type(item) for item in field.any_of] == [
+        typesystem.Boolean,
+        typesystem.Integer,
+        typesystem.String,
+    ]
+
+
+def test_from_json_schema_memoizes_repeated_subschemas():
+    address = {"type": "object", "properties": {"street": {"type": "string"}}}
+    field = from_json_schema(
+        {
+            "type": "object",
+            "properties": {
+                "billing": address,
+                "shipping": dict(address),
+                "flag": {"enum": [True]},
+                "number": {"enum": [1]},
+            },
+        }
+    )
+
+    properties = field.properties
+    assert properties["billing"] is properties["shipping"]
+    assert properties["flag"] is not properties["number"]
+    assert properties["flag"].validate_or_error(True)
+    assert not properties["flag"].validate_or_error(1)
+    assert from_json_schema(address) is not properties["billing"]
+
+
+def test_from_json_schema_preserves_property_order():
+    field = from_json_schema(
+        {
+            "type": "object",
+            "properties": {
+                "first": {"type": "object", "properties": {"a": {}, "b": {}}},
+                "second": {"type": "object", "properties": {"b": {}, "a": {}}},
+            },
+        }
+    )
+    first = field.properties["first"]
+    second = field.properties["second"]
+    assert list(first.properties) == ["a", "b"]
+    assert list(second.properties) == ["b", "a"]
+    assert list(second.validate({"a": 1, "b": 2})) == ["b", "a"]
+
+
+def test_from_json_schema_does_not_share_fields_between_calls():
+    definitions = typesystem.Definitions()
+    document = {"type": "object", "properties": {"x": {"type": ["string", "integer"]}}}
+    field = from_json_schema(document, definitions=definitions)
+    field.properties["x"] | typesystem.Boolean()
+
+    other = from_json_schema(document, definitions=definitions)
+    assert other is not field
+    assert not other.validate_or_error({"x": True})
+
+
+def test_from_json_schema_reconverts_modified_document():
+    definitions = typesystem.Definitions()
+    document = {"type": "object", "properties": {"age": {"type": "integer"}}}
+    field = from_json_schema(document, definitions=definitions)
+
+    document["properties"]["age"]["minimum"] = 18
+    changed = from_json_schema(document, definitions=definitions)
+    assert changed is not field
+    assert field.validate_or_error({"age": 10})
+    assert not changed.validate_or_error({"age": 10})
+
+
+def test_from_json_schema_unhashable_values():
+    field = from_json_schema(
+        {
+            "type": "object",
+            "properties": {
+                "a": {"type": "array", "items": {"type": "string"}},
+                "b": {"type": "array", "items": {}, "default": {1, 2}},
+            },
+        }
+    )
+    assert field.properties["b"].get_default_value() == {1, 2}
+    assert field.validate({"a": ["x"]}) == {"a": ["x"], "b": {1, 2}}
+
+
+def test_from_json_schema_type_lists():
+    field = from_json_schema({"type": ["null"]})
+    assert isinstance(field, typesystem.fields.Const)
+    assert field.validate(None) is None
+    assert not field.validate_or_error(1)
+
+    field = from_json_schema({"type": ["integer", "null"]})
+    assert isinstance(field, typesystem.Integer)
+    assert field.allow_null
+    assert field.validate(None) is None
+    assert field.validate(1) == 1
+    assert not field.validate_or_error("a")
+
+
+def test_from_json_schema_number_subsumes_integer():
+    field = from_json_schema({"type": ["integer", "number", "string"]})
+    assert isinstance(field, typesystem.Union)
+    assert [type(item) for item in field.any_of] == [
+        typesystem.Float,
+        typesystem.String,
+    ]
+    assert field.validate(1.5) == 1.5
+
+
+def test_from_json_schema_shares_references():
+    field = from_json_schema(
+        {
+            "components": {"schemas": {"Name": {"type": "string"}}},
+            "type": "object",
+            "properties": {
+                "first": {"$ref": "#/components/schemas/Name"},
+                "last": {"$ref": "#/components/schemas/Name", "title": "Last"},
+            },
+        }
+    )
+
+    properties = field.properties
+    assert properties["first"] is properties["last"]
+    assert properties["first"].validate("Jane") == "Jane"
+
+
+def test_ref_from_json_schema_outside_conversion():
+    definitions = typesystem.Definitions({"#/Name": typesystem.String()})
+    field = ref_from_json_schema({"$ref": "#/Name"}, definitions=definitions)
+    assert isinstance(field, typesystem.Reference)
+    assert field.validate("Jane") == "Jane"
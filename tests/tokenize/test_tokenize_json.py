@@ -1,6 +1,7 @@
 import pytest
 
 from typesystem import ParseError, tokenize_json
+from typesystem.base import Position
 from typesystem.tokenize.tokens import DictToken, ListToken, ScalarToken
 
 
@@ -31,6 +32,33 @@ def test_tokenize_object():
     assert token.lookup_key(["a"]).end.char_index == 3
 
 
+def test_token_positions():
+    token = tokenize_json('{\n  "a": [1,\n    2]\n}')
+    assert token.lookup(["a", 0]).start == Position(2, 9, 10)
+    assert token.lookup(["a", 1]).start == Position(3, 5, 17)
+    assert token.end == Position(4, 1, 20)
+    assert ScalarToken("a", 0, 0).start == Position(1, 1, 0)
+
+
+def test_token_positions_with_carriage_returns():
+    token = tokenize_json('{\r\n  "a": [1,\r\n    2]\r\n}')
+    assert token.lookup(["a", 0]).start == Position(2, 9, 11)
+    assert token.lookup(["a", 1]).start == Position(3, 5, 19)
+    assert token.lookup(["a"]).end == Position(3, 6, 20)
+    assert token.end == Position(4, 1, 23)
+
+    token = tokenize_json('{\r  "a": [1,\r    2]\r}')
+    assert token.lookup(["a", 0]).start == Position(2, 9, 10)
+    assert token.lookup(["a", 1]).start == Position(3, 5, 17)
+    assert token.end == Position(4, 1, 20)
+
+
+def test_token_repr_truncates_long_content():
+    token = tokenize_json('{"key": "%s"}' % ("x" * 50))
+    assert repr(token) == 'DictToken(\'{"key": "%s...\')' % ("x" * 28)
+    assert repr(token.lookup(["key"])) == "ScalarToken('\"%s...')" % ("x" * 36)
+
+
 def test_tokenize_list():
     token = tokenize_json("[true, false, null]")
     expected = ListToken(
@@ -85,6 +113,13 @@ def test_tokenize_whitespace():
     assert token.lookup_key(["a"]).start.char_index == 2
     assert token.lookup_key(["a"]).end.char_index == 4
 
+    token = tokenize_json('{"a":1,"b":2, "c":3,\n  "d":4}')
+    assert token.value == {"a": 1, "b": 2, "c": 3, "d": 4}
+    assert token.lookup_key(["b"]).start.char_index == 7
+    assert token.lookup_key(["c"]).start.char_index == 14
+    assert token.lookup_key(["d"]).start.char_index == 23
+    assert token.lookup_key(["d"]).start.line_no == 2
+
 
 def test_tokenize_parse_errors():
     with pytest.raises(ParseError) as exc_info:
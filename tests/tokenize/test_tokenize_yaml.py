@@ -1,6 +1,7 @@
 import pytest
 
 from typesystem import ParseError, tokenize_yaml
+from typesystem.base import Position
 from typesystem.tokenize.tokens import DictToken, ListToken, ScalarToken
 
 YAML_OBJECT = """
@@ -38,6 +39,10 @@ def test_tokenize_object():
         31,
     )
     assert token == expected
+    assert token.start == Position(line_no=2, column_no=1, char_index=1)
+    assert token.end == Position(line_no=6, column_no=9, char_index=31)
+    assert token.lookup(["a"]).end == Position(line_no=5, column_no=5, char_index=21)
+    assert token.lookup(["b"]).start == Position(line_no=6, column_no=4, char_index=25)
 
 
 def test_tokenize_list():
@@ -68,6 +73,13 @@ def test_tokenize_parse_errors():
     assert message.text == "No content."
     assert message.start_position.char_index == 0
 
+    with pytest.raises(ParseError) as exc_info:
+        tokenize_yaml(b" \n\t")
+    exc = exc_info.value
+    message = exc.messages()[0]
+    assert message.text == "No content."
+    assert message.start_position.char_index == 0
+
     with pytest.raises(ParseError) as exc_info:
         tokenize_yaml('{"a" 1}')
     exc = exc_info.value
@@ -68,3 +68,39 @@ def test_validate_json():
             end_position=Position(line_no=1, column_no=12, char_index=11),
         )
     ]
+
+    validator = Schema(
+        fields={
+            "a": Integer(),
+            "b": Object(properties={"c": Integer()}),
+            "d": Integer(),
+        }
+    )
+
+    text = '{"b": {"c": "x"}, "a": "y"}'
+    with pytest.raises(ValidationError) as exc_info:
+        validate_json(text, validator=validator)
+    exc = exc_info.value
+    assert exc.messages() == [
+        Message(
+            text="The field 'd' is required.",
+            code="required",
+            index=["d"],
+            start_position=Position(line_no=1, column_no=1, char_index=0),
+            end_position=Position(line_no=1, column_no=27, char_index=26),
+        ),
+        Message(
+            text="Must be a number.",
+            code="type",
+            index=["b", "c"],
+            start_position=Position(line_no=1, column_no=13, char_index=12),
+            end_position=Position(line_no=1, column_no=15, char_index=14),
+        ),
+        Message(
+            text="Must be a number.",
+            code="type",
+            index=["a"],
+            start_position=Position(line_no=1, column_no=24, char_index=23),
+            end_position=Position(line_no=1, column_no=26, char_index=25),
+        ),
+    ]
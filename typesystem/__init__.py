@@ -23,7 +23,11 @@ from typesystem.fields import (
     Union,
 )
 from typesystem.forms import Jinja2Forms
-from typesystem.json_schema import from_json_schema, to_json_schema
+from typesystem.json_schema import (
+    compile_from_json_schema,
+    from_json_schema,
+    to_json_schema,
+)
 from typesystem.schemas import Definitions, Reference, Schema
 from typesystem.tokenize.positional_validation import validate_with_positions
 from typesystem.tokenize.tokenize_json import tokenize_json, validate_json
@@ -63,6 +67,7 @@ __all__ = [
     "Message",
     "Position",
     # JSON Schema
+    "compile_from_json_schema",
     "from_json_schema",
     "to_json_schema",
     # Positional error marking
@@ -104,8 +104,8 @@ class IfThenElse(Field):
     def __init__(
         self,
         if_clause: Field,
-        then_clause: Field = None,
-        else_clause: Field = None,
+        then_clause: typing.Optional[Field] = None,
+        else_clause: typing.Optional[Field] = None,
         **kwargs: typing.Any
     ) -> None:
         assert "allow_null" not in kwargs
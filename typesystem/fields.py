@@ -1,6 +1,7 @@
 import decimal
 import re
 import typing
+from collections.abc import Mapping
 from math import isfinite
 
 from typesystem import formats
@@ -8,6 +9,8 @@ from typesystem.base import Message, ValidationError, ValidationResult
 from typesystem.unique import Uniqueness
 
 NO_DEFAULT = object()
+# Marks a key that is absent from the mapping being validated.
+MISSING = object()
 
 FORMATS = {
     "date": formats.DateFormat(),
@@ -105,10 +108,10 @@ class String(Field):
         *,
         allow_blank: bool = False,
         trim_whitespace: bool = True,
-        max_length: int = None,
-        min_length: int = None,
-        pattern: typing.Union[str, typing.Pattern] = None,
-        format: str = None,
+        max_length: typing.Optional[int] = None,
+        min_length: typing.Optional[int] = None,
+        pattern: typing.Union[str, typing.Pattern, None] = None,
+        format: typing.Optional[str] = None,
         coerce_types: bool = True,
         **kwargs: typing.Any,
     ) -> None:
@@ -205,12 +208,12 @@ class Number(Field):
     def __init__(
         self,
         *,
-        minimum: typing.Union[int, float, decimal.Decimal] = None,
-        maximum: typing.Union[int, float, decimal.Decimal] = None,
-        exclusive_minimum: typing.Union[int, float, decimal.Decimal] = None,
-        exclusive_maximum: typing.Union[int, float, decimal.Decimal] = None,
-        precision: str = None,
-        multiple_of: typing.Union[int, float, decimal.Decimal] = None,
+        minimum: typing.Union[int, float, decimal.Decimal, None] = None,
+        maximum: typing.Union[int, float, decimal.Decimal, None] = None,
+        exclusive_minimum: typing.Union[int, float, decimal.Decimal, None] = None,
+        exclusive_maximum: typing.Union[int, float, decimal.Decimal, None] = None,
+        precision: typing.Optional[str] = None,
+        multiple_of: typing.Union[int, float, decimal.Decimal, None] = None,
         coerce_types: bool = True,
         **kwargs: typing.Any,
     ):
@@ -409,13 +412,13 @@ class Object(Field):
     def __init__(
         self,
         *,
-        properties: typing.Dict[str, Field] = None,
-        pattern_properties: typing.Dict[str, Field] = None,
+        properties: typing.Optional[typing.Dict[str, Field]] = None,
+        pattern_properties: typing.Optional[typing.Dict[str, Field]] = None,
         additional_properties: typing.Union[bool, None, Field] = True,
-        property_names: Field = None,
-        min_properties: int = None,
-        max_properties: int = None,
-        required: typing.Sequence[str] = None,
+        property_names: typing.Optional[Field] = None,
+        min_properties: typing.Optional[int] = None,
+        max_properties: typing.Optional[int] = None,
+        required: typing.Optional[typing.Sequence[str]] = None,
         **kwargs: typing.Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -455,7 +458,7 @@ class Object(Field):
             return None
         elif value is None:
             raise self.validation_error("null")
-        elif not isinstance(value, (dict, typing.Mapping)):
+        elif type(value) is not dict and not isinstance(value, Mapping):
             raise self.validation_error("type")
 
         validated = {}
@@ -494,11 +497,11 @@ class Object(Field):
 
         # Properties
         for key, child_schema in self.properties.items():
-            if key not in value:
+            item = value.get(key, MISSING)
+            if item is MISSING:
                 if child_schema.has_default():
                     validated[key] = child_schema.get_default_value()
                 continue
-            item = value[key]
             child_value, error = child_schema.validate_or_error(item)
             if not error:
                 validated[key] = child_value
@@ -566,11 +569,11 @@ class Array(Field):
 
     def __init__(
         self,
-        items: typing.Union[Field, typing.Sequence[Field]] = None,
+        items: typing.Union[Field, typing.Sequence[Field], None] = None,
         additional_items: typing.Union[Field, bool] = False,
-        min_items: int = None,
-        max_items: int = None,
-        exact_items: int = None,
+        min_items: typing.Optional[int] = None,
+        max_items: typing.Optional[int] = None,
+        exact_items: typing.Optional[int] = None,
         unique_items: bool = False,
         **kwargs: typing.Any,
     ) -> None:
@@ -676,7 +679,8 @@ class Array(Field):
         if self.items is None:
             return obj
 
-        return [self.items.serialize(value) for value in obj]
+        serialize = self.items.serialize
+        return [serialize(value) for value in obj]
 
 
 class Text(String):
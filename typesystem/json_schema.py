@@ -1,9 +1,14 @@
 """
 Provides 'typesystem.from_json_schema()' and 'typesystem.to_json_schema()'.
 """
+
 import re
+import threading
 import typing
+from collections.abc import Mapping
+from math import isfinite
 
+from typesystem.base import Message, ValidationError
 from typesystem.composites import AllOf, IfThenElse, NeverMatch, Not, OneOf
 from typesystem.fields import (
     NO_DEFAULT,
@@ -22,33 +27,51 @@ from typesystem.fields import (
     Union,
 )
 from typesystem.schemas import Definitions, Reference, Schema
+from typesystem.unique import Uniqueness
+
+TYPE_CONSTRAINTS = frozenset(
+    {
+        "additionalItems",
+        "additionalProperties",
+        "boolean_schema",
+        "contains",
+        "dependencies",
+        "exclusiveMaximum",
+        "exclusiveMinimum",
+        "items",
+        "maxItems",
+        "maxLength",
+        "maxProperties",
+        "maximum",
+        "minItems",
+        "minLength",
+        "minProperties",
+        "minimum",
+        "multipleOf",
+        "pattern",
+        "patternProperties",
+        "properties",
+        "propertyNames",
+        "required",
+        "type",
+        "uniqueItems",
+    }
+)
 
-TYPE_CONSTRAINTS = {
-    "additionalItems",
-    "additionalProperties",
-    "boolean_schema",
-    "contains",
-    "dependencies",
-    "exclusiveMaximum",
-    "exclusiveMinimum",
-    "items",
-    "maxItems",
-    "maxLength",
-    "maxProperties",
-    "maximum",
-    "minItems",
-    "minLength",
-    "minProperties",
-    "minimum",
-    "multipleOf",
-    "pattern",
-    "patternProperties",
-    "properties",
-    "propertyNames",
-    "required",
-    "type",
-    "uniqueItems",
-}
+NUMERIC_CONSTRAINTS = frozenset(
+    {"minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "multipleOf"}
+)
+
+# Keywords that each add a constraint alongside any typed field.
+COMPOSITE_CONSTRAINTS = frozenset(
+    {"enum", "const", "allOf", "anyOf", "oneOf", "not", "if"}
+)
+
+DEFAULT_TYPES = frozenset({"null", "boolean", "object", "array", "number", "string"})
+DEFAULT_TYPES_NO_NULL = DEFAULT_TYPES - {"null"}
+
+# The flags of a plain `re.compile(pattern)`, as a raw int for cheap comparison.
+UNICODE_FLAGS = int(re.RegexFlag.UNICODE)
 
 
 definitions = Definitions()
@@ -107,11 +130,91 @@ JSONSchema = (
 definitions["JSONSchema"] = JSONSchema
 
 
+class ConversionCache:
+    """
+    Memoizes converted subschemas by content, so that repeated subschemas
+    within a document are only converted once.
+
+    A cache only lives for the duration of a single top-level conversion,
+    so fields are never shared between separate calls to `from_json_schema`.
+    """
+
+    def __init__(self) -> None:
+        self.fields: typing.Dict[int, Field] = {}
+        # A single `Reference` per target, however many `$ref` nodes name it.
+        self.references: typing.Dict[str, Reference] = {}
+        # The content of each distinct object, interned to a small integer.
+        self.interned: typing.Dict[tuple, int] = {}
+        # The interned key of every object in the document, by id. The
+        # document outlives the conversion, so the ids can't be reused.
+        self.keys: typing.Dict[int, int] = {}
+
+    def freeze(self, value: dict) -> typing.Hashable:
+        """
+        Return the key of a JSON object, by content.
+
+        Keys are built bottom-up, so that an object's content only refers to
+        the keys of the objects within it. Hashing it then takes time in
+        proportion to its own items, rather than to its whole subtree.
+        """
+        items: typing.List[tuple] = []
+        nested = False
+        for k, v in value.items():
+            value_type = type(v)
+            if value_type is str:
+                items.append((k, v))
+            elif isinstance(v, dict):
+                items.append((k, dict, self.freeze(v)))
+                nested = True
+            elif isinstance(v, list):
+                items.append((k, list, self.freeze_list(v)))
+                nested = True
+            else:
+                # Tag other values with their type, so that eg. `True` and `1`
+                # are distinct keys.
+                items.append((k, value_type, v))
+        content = tuple(items)
+        if not nested:
+            # Objects without nested values are cheaper to convert again than
+            # to memoize, so they are keyed by their content alone.
+            return content
+        interned = self.interned
+        key = self.keys[id(value)] = interned.setdefault(content, len(interned))
+        return key
+
+    def freeze_list(self, value: list) -> tuple:
+        items: typing.List[tuple] = []
+        for v in value:
+            if isinstance(v, dict):
+                items.append((dict, self.freeze(v)))
+            elif isinstance(v, list):
+                items.append((list, self.freeze_list(v)))
+            else:
+                items.append((type(v), v))
+        return tuple(items)
+
+
+class ConversionCaches(threading.local):
+    """
+    The caches of the conversions in progress on this thread.
+
+    Caches are keyed by the id of their `Definitions`, which are mappings and
+    so unhashable. Each entry is removed as its conversion completes, while
+    the definitions are still alive, so an id can never be reused for them.
+    """
+
+    def __init__(self) -> None:
+        self.caches: typing.Dict[int, ConversionCache] = {}
+
+
+_conversion_caches = ConversionCaches()
+
+
 def from_json_schema(
     data: typing.Union[bool, dict], definitions: Definitions = None
 ) -> Field:
     if isinstance(data, bool):
-        return {True: Any(), False: NeverMatch()}[data]
+        return Any() if data else NeverMatch()
 
     if definitions is None:
         definitions = Definitions()
@@ -119,55 +222,134 @@ def from_json_schema(
             ref = f"#/components/schemas/{key}"
             definitions[ref] = from_json_schema(value, definitions=definitions)
 
+    caches = _conversion_caches.caches
+    cache = caches.get(id(definitions))
+    if cache is None:
+        cache = ConversionCache()
+        try:
+            cache.freeze(data)
+        except TypeError:
+            # Any objects whose content can't be hashed are left without a
+            # key, and are converted without caching.
+            pass
+        if not cache.keys:
+            # There are no nested objects, so nothing that could repeat.
+            return _from_json_schema(data, definitions=definitions)
+        caches[id(definitions)] = cache
+        try:
+            return _from_json_schema(data, definitions=definitions)
+        finally:
+            del caches[id(definitions)]
+
+    key = cache.keys.get(id(data))
+    if key is None:
+        return _from_json_schema(data, definitions=definitions)
+    field = cache.fields.get(key)
+    if field is None:
+        field = cache.fields[key] = _from_json_schema(data, definitions=definitions)
+    return field
+
+
+def _from_json_schema(data: dict, definitions: Definitions) -> Field:
+    """
+    Build a field from a JSON schema object, without consulting the cache.
+    """
     if "$ref" in data:
         return ref_from_json_schema(data, definitions=definitions)
 
+    # Read once here, rather than in each of the builders below.
+    default = data.get("default", NO_DEFAULT)
+    if COMPOSITE_CONSTRAINTS.isdisjoint(data):
+        # Fast path for the common case of a plain typed schema, which
+        # skips probing for each of the composite keywords in turn.
+        if TYPE_CONSTRAINTS.isdisjoint(data):
+            return Any()
+        return type_from_json_schema(data, default=default, definitions=definitions)
+
     constraints = []  # typing.List[Field]
-    if any([property_name in data for property_name in TYPE_CONSTRAINTS]):
-        constraints.append(type_from_json_schema(data, definitions=definitions))
+    if not TYPE_CONSTRAINTS.isdisjoint(data):
+        constraints.append(
+            type_from_json_schema(data, default=default, definitions=definitions)
+        )
     if "enum" in data:
-        constraints.append(enum_from_json_schema(data, definitions=definitions))
+        constraints.append(
+            enum_from_json_schema(data, default=default, definitions=definitions)
+        )
     if "const" in data:
-        constraints.append(const_from_json_schema(data, definitions=definitions))
+        constraints.append(
+            const_from_json_schema(data, default=default, definitions=definitions)
+        )
     if "allOf" in data:
-        constraints.append(all_of_from_json_schema(data, definitions=definitions))
+        constraints.append(
+            all_of_from_json_schema(data, default=default, definitions=definitions)
+        )
     if "anyOf" in data:
-        constraints.append(any_of_from_json_schema(data, definitions=definitions))
+        constraints.append(
+            any_of_from_json_schema(data, default=default, definitions=definitions)
+        )
     if "oneOf" in data:
-        constraints.append(one_of_from_json_schema(data, definitions=definitions))
+        constraints.append(
+            one_of_from_json_schema(data, default=default, definitions=definitions)
+        )
     if "not" in data:
-        constraints.append(not_from_json_schema(data, definitions=definitions))
+        constraints.append(
+            not_from_json_schema(data, default=default, definitions=definitions)
+        )
     if "if" in data:
-        constraints.append(if_then_else_from_json_schema(data, definitions=definitions))
+        constraints.append(
+            if_then_else_from_json_schema(
+                data, default=default, definitions=definitions
+            )
+        )
 
+    # At least one composite keyword is present, so there is a constraint.
     if len(constraints) == 1:
         return constraints[0]
-    elif len(constraints) > 1:
-        return AllOf(constraints)
-    return Any()
+    return AllOf(flatten_all_of(constraints))
 
 
-def type_from_json_schema(data: dict, definitions: Definitions) -> Field:
+def type_from_json_schema(
+    data: dict, default: typing.Any, definitions: Definitions
+) -> Field:
     """
     Build a typed field or union of typed fields from a JSON schema object.
     """
+    type_string = data.get("type")
+    if isinstance(type_string, str):
+        if type_string == "null":
+            return Const(None)
+        # Call the builder directly, since this frame recurs at every level
+        # of a nested schema.
+        builder = TYPE_BUILDERS.get(type_string)
+        assert builder is not None, f"Invalid argument type_string={type_string!r}"
+        return builder(data, allow_null=False, default=default, definitions=definitions)
+
     type_strings, allow_null = get_valid_types(data)
 
     if len(type_strings) > 1:
+        # Sort for a deterministic `Union` ordering, since sets are unordered.
         items = [
             from_json_schema_type(
-                data, type_string=type_string, allow_null=False, definitions=definitions
+                data,
+                type_string=type_string,
+                allow_null=False,
+                default=default,
+                definitions=definitions,
             )
-            for type_string in type_strings
+            for type_string in sorted(type_strings)
         ]
         return Union(any_of=items, allow_null=allow_null)
 
     if len(type_strings) == 0:
-        return {True: Const(None), False: NeverMatch()}[allow_null]
+        return Const(None) if allow_null else NeverMatch()
 
     type_string = type_strings.pop()
     return from_json_schema_type(
-        data, type_string=type_string, allow_null=allow_null, definitions=definitions
+        data,
+        type_string=type_string,
+        allow_null=allow_null,
+        default=default,
+        definitions=definitions,
     )
 
 
@@ -178,12 +360,15 @@ def get_valid_types(data: dict) -> typing.Tuple[typing.Set[str], bool]:
 
     type_strings = data.get("type", [])
     if isinstance(type_strings, str):
-        type_strings = {type_strings}
-    else:
-        type_strings = set(type_strings)
+        # A single type name needs none of the set arithmetic below.
+        if type_strings == "null":
+            return (set(), True)
+        return ({type_strings}, False)
 
     if not type_strings:
-        type_strings = {"null", "boolean", "object", "array", "number", "string"}
+        return (set(DEFAULT_TYPES_NO_NULL), True)
+
+    type_strings = set(type_strings)
 
     if "number" in type_strings:
         type_strings.discard("integer")
@@ -197,188 +382,263 @@ def get_valid_types(data: dict) -> typing.Tuple[typing.Set[str], bool]:
 
 
 def from_json_schema_type(
-    data: dict, type_string: str, allow_null: bool, definitions: Definitions
+    data: dict,
+    type_string: str,
+    allow_null: bool,
+    default: typing.Any,
+    definitions: Definitions,
 ) -> Field:
     """
     Build a typed field from a JSON schema object.
     """
+    builder = TYPE_BUILDERS.get(type_string)
+    assert builder is not None, f"Invalid argument type_string={type_string!r}"
+    return builder(
+        data, allow_null=allow_null, default=default, definitions=definitions
+    )
 
-    if type_string == "number":
-        kwargs = {
-            "allow_null": allow_null,
-            "minimum": data.get("minimum", None),
-            "maximum": data.get("maximum", None),
-            "exclusive_minimum": data.get("exclusiveMinimum", None),
-            "exclusive_maximum": data.get("exclusiveMaximum", None),
-            "multiple_of": data.get("multipleOf", None),
-            "default": data.get("default", NO_DEFAULT),
-            "coerce_types": False,
-        }
-        return Float(**kwargs)
-
-    elif type_string == "integer":
-        kwargs = {
-            "allow_null": allow_null,
-            "minimum": data.get("minimum", None),
-            "maximum": data.get("maximum", None),
-            "exclusive_minimum": data.get("exclusiveMinimum", None),
-            "exclusive_maximum": data.get("exclusiveMaximum", None),
-            "multiple_of": data.get("multipleOf", None),
-            "default": data.get("default", NO_DEFAULT),
-            "coerce_types": False,
-        }
-        return Integer(**kwargs)
 
-    elif type_string == "string":
-        min_length = data.get("minLength", 0)
-        kwargs = {
-            "allow_null": allow_null,
-            "allow_blank": min_length == 0,
-            "min_length": min_length if min_length > 1 else None,
-            "max_length": data.get("maxLength", None),
-            "format": data.get("format"),
-            "pattern": data.get("pattern", None),
-            "default": data.get("default", NO_DEFAULT),
-            "coerce_types": False,
-        }
-        return String(**kwargs)
+def number_from_json_schema(
+    data: dict, allow_null: bool, default: typing.Any, definitions: Definitions
+) -> Field:
+    return numeric_from_json_schema(Float, data, allow_null=allow_null, default=default)
 
-    elif type_string == "boolean":
-        kwargs = {
-            "allow_null": allow_null,
-            "default": data.get("default", NO_DEFAULT),
-            "coerce_types": False,
-        }
-        return Boolean(**kwargs)
-
-    elif type_string == "array":
-        items = data.get("items", None)
-        if items is None:
-            items_argument: typing.Union[None, Field, typing.List[Field]] = None
-        elif isinstance(items, list):
-            items_argument = [
-                from_json_schema(item, definitions=definitions) for item in items
-            ]
-        else:
-            items_argument = from_json_schema(items, definitions=definitions)
 
-        additional_items = data.get("additionalItems", None)
-        if additional_items is None:
-            additional_items_argument: typing.Union[bool, Field] = True
-        elif isinstance(additional_items, bool):
-            additional_items_argument = additional_items
-        else:
-            additional_items_argument = from_json_schema(
-                additional_items, definitions=definitions
-            )
+def integer_from_json_schema(
+    data: dict, allow_null: bool, default: typing.Any, definitions: Definitions
+) -> Field:
+    return numeric_from_json_schema(
+        Integer, data, allow_null=allow_null, default=default
+    )
 
-        kwargs = {
-            "allow_null": allow_null,
-            "min_items": data.get("minItems", 0),
-            "max_items": data.get("maxItems", None),
-            "additional_items": additional_items_argument,
-            "items": items_argument,
-            "unique_items": data.get("uniqueItems", False),
-            "default": data.get("default", NO_DEFAULT),
-        }
-        return Array(**kwargs)
 
-    elif type_string == "object":
-        properties = data.get("properties", None)
-        if properties is None:
-            properties_argument: typing.Optional[typing.Dict[str, Field]] = None
-        else:
-            properties_argument = {
-                key: from_json_schema(value, definitions=definitions)
-                for key, value in properties.items()
-            }
-
-        pattern_properties = data.get("patternProperties", None)
-        if pattern_properties is None:
-            pattern_properties_argument: typing.Optional[typing.Dict[str, Field]] = None
-        else:
-            pattern_properties_argument = {
-                key: from_json_schema(value, definitions=definitions)
-                for key, value in pattern_properties.items()
-            }
-
-        additional_properties = data.get("additionalProperties", None)
-        if additional_properties is None:
-            additional_properties_argument: typing.Union[None, bool, Field] = None
-        elif isinstance(additional_properties, bool):
-            additional_properties_argument = additional_properties
-        else:
-            additional_properties_argument = from_json_schema(
-                additional_properties, definitions=definitions
-            )
+def numeric_from_json_schema(
+    field_class: typing.Type[Number],
+    data: dict,
+    allow_null: bool,
+    default: typing.Any,
+) -> Field:
+    get = data.get
+    if data.keys().isdisjoint(NUMERIC_CONSTRAINTS):
+        # Fast path for the common case of a bare numeric type.
+        return field_class(
+            allow_null=allow_null,
+            default=default,
+            coerce_types=False,
+        )
+    return field_class(
+        allow_null=allow_null,
+        minimum=get("minimum"),
+        maximum=get("maximum"),
+        exclusive_minimum=get("exclusiveMinimum"),
+        exclusive_maximum=get("exclusiveMaximum"),
+        multiple_of=get("multipleOf"),
+        default=default,
+        coerce_types=False,
+    )
 
-        property_names = data.get("propertyNames", None)
-        if property_names is None:
-            property_names_argument: typing.Optional[Field] = None
-        else:
-            property_names_argument = from_json_schema(
-                property_names, definitions=definitions
-            )
 
-        kwargs = {
-            "allow_null": allow_null,
-            "properties": properties_argument,
-            "pattern_properties": pattern_properties_argument,
-            "additional_properties": additional_properties_argument,
-            "property_names": property_names_argument,
-            "min_properties": data.get("minProperties", None),
-            "max_properties": data.get("maxProperties", None),
-            "required": data.get("required", None),
-            "default": data.get("default", NO_DEFAULT),
-        }
-        return Object(**kwargs)
+def string_from_json_schema(
+    data: dict, allow_null: bool, default: typing.Any, definitions: Definitions
+) -> Field:
+    get = data.get
+    min_length = get("minLength", 0)
+    return String(
+        allow_null=allow_null,
+        allow_blank=min_length == 0,
+        min_length=min_length if min_length > 1 else None,
+        max_length=get("maxLength"),
+        format=get("format"),
+        pattern=get("pattern"),
+        default=default,
+        coerce_types=False,
+    )
+
 
-    assert False, f"Invalid argument type_string={type_string!r}"  # pragma: no cover
+def boolean_from_json_schema(
+    data: dict, allow_null: bool, default: typing.Any, definitions: Definitions
+) -> Field:
+    return Boolean(
+        allow_null=allow_null,
+        default=default,
+        coerce_types=False,
+    )
+
+
+def array_from_json_schema(
+    data: dict, allow_null: bool, default: typing.Any, definitions: Definitions
+) -> Field:
+    # Bind locally to skip the global lookup on every item.
+    convert = from_json_schema
+    get = data.get
+    items = get("items")
+    if items is None:
+        items_argument: typing.Union[None, Field, typing.List[Field]] = None
+    elif isinstance(items, list):
+        items_argument = [convert(item, definitions=definitions) for item in items]
+    else:
+        items_argument = from_json_schema(items, definitions=definitions)
+
+    additional_items = get("additionalItems")
+    if additional_items is None:
+        additional_items_argument: typing.Union[bool, Field] = True
+    elif isinstance(additional_items, bool):
+        additional_items_argument = additional_items
+    else:
+        additional_items_argument = from_json_schema(
+            additional_items, definitions=definitions
+        )
+
+    return Array(
+        allow_null=allow_null,
+        min_items=get("minItems", 0),
+        max_items=get("maxItems"),
+        additional_items=additional_items_argument,
+        items=items_argument,
+        unique_items=get("uniqueItems", False),
+        default=default,
+    )
+
+
+def object_from_json_schema(
+    data: dict, allow_null: bool, default: typing.Any, definitions: Definitions
+) -> Field:
+    # Bind locally to skip the global lookup on every property.
+    convert = from_json_schema
+    get = data.get
+    # Plain loops rather than comprehensions, which run in a frame of their
+    # own before Python 3.12, and so would add a frame to every level of
+    # nested properties.
+    properties = get("properties")
+    if properties is None:
+        properties_argument: typing.Optional[typing.Dict[str, Field]] = None
+    else:
+        properties_argument = {}
+        for key, value in properties.items():
+            properties_argument[key] = convert(value, definitions=definitions)
+
+    pattern_properties = get("patternProperties")
+    if pattern_properties is None:
+        pattern_properties_argument: typing.Optional[typing.Dict[str, Field]] = None
+    else:
+        pattern_properties_argument = {}
+        for key, value in pattern_properties.items():
+            pattern_properties_argument[key] = convert(value, definitions=definitions)
+
+    additional_properties = get("additionalProperties")
+    if additional_properties is None:
+        additional_properties_argument: typing.Union[None, bool, Field] = None
+    elif isinstance(additional_properties, bool):
+        additional_properties_argument = additional_properties
+    else:
+        additional_properties_argument = from_json_schema(
+            additional_properties, definitions=definitions
+        )
+
+    property_names = get("propertyNames")
+    if property_names is None:
+        property_names_argument: typing.Optional[Field] = None
+    else:
+        property_names_argument = from_json_schema(
+            property_names, definitions=definitions
+        )
+
+    return Object(
+        allow_null=allow_null,
+        properties=properties_argument,
+        pattern_properties=pattern_properties_argument,
+        additional_properties=additional_properties_argument,
+        property_names=property_names_argument,
+        min_properties=get("minProperties"),
+        max_properties=get("maxProperties"),
+        required=get("required"),
+        default=default,
+    )
+
+
+TYPE_BUILDERS: typing.Dict[str, typing.Callable[..., Field]] = {
+    "number": number_from_json_schema,
+    "integer": integer_from_json_schema,
+    "string": string_from_json_schema,
+    "boolean": boolean_from_json_schema,
+    "array": array_from_json_schema,
+    "object": object_from_json_schema,
+}
 
 
 def ref_from_json_schema(data: dict, definitions: Definitions) -> Field:
     reference_string = data["$ref"]
     assert reference_string.startswith("#/"), "Unsupported $ref style in document."
-    return Reference(to=reference_string, definitions=definitions)
-
-
-def enum_from_json_schema(data: dict, definitions: Definitions) -> Field:
+    cache = _conversion_caches.caches.get(id(definitions))
+    if cache is None:
+        return Reference(to=reference_string, definitions=definitions)
+    reference = cache.references.get(reference_string)
+    if reference is None:
+        reference = Reference(to=reference_string, definitions=definitions)
+        cache.references[reference_string] = reference
+    return reference
+
+
+def enum_from_json_schema(
+    data: dict, default: typing.Any, definitions: Definitions
+) -> Field:
     choices = [(item, item) for item in data["enum"]]
-    kwargs = {"choices": choices, "default": data.get("default", NO_DEFAULT)}
-    return Choice(**kwargs)
+    return Choice(choices=choices, default=default)
 
 
-def const_from_json_schema(data: dict, definitions: Definitions) -> Field:
+def const_from_json_schema(
+    data: dict, default: typing.Any, definitions: Definitions
+) -> Field:
     const = data["const"]
-    kwargs = {"const": const, "default": data.get("default", NO_DEFAULT)}
-    return Const(**kwargs)
+    return Const(const=const, default=default)
 
 
-def all_of_from_json_schema(data: dict, definitions: Definitions) -> Field:
+def all_of_from_json_schema(
+    data: dict, default: typing.Any, definitions: Definitions
+) -> Field:
     all_of = [from_json_schema(item, definitions=definitions) for item in data["allOf"]]
-    kwargs = {"all_of": all_of, "default": data.get("default", NO_DEFAULT)}
-    return AllOf(**kwargs)
+    all_of = flatten_all_of(all_of)
+    return AllOf(all_of=all_of, default=default)
 
 
-def any_of_from_json_schema(data: dict, definitions: Definitions) -> Field:
+def flatten_all_of(fields: typing.List[Field]) -> typing.List[Field]:
+    """
+    Splice the children of any nested `AllOf` without a default into the list,
+    so that validation doesn't need to walk a tree of `AllOf` nodes.
+    """
+    flattened: typing.List[Field] = []
+    for field in fields:
+        if isinstance(field, AllOf) and not field.has_default():
+            flattened.extend(field.all_of)
+        else:
+            flattened.append(field)
+    return flattened
+
+
+def any_of_from_json_schema(
+    data: dict, default: typing.Any, definitions: Definitions
+) -> Field:
     any_of = [from_json_schema(item, definitions=definitions) for item in data["anyOf"]]
-    kwargs = {"any_of": any_of, "default": data.get("default", NO_DEFAULT)}
-    return Union(**kwargs)
+    return Union(any_of=any_of, default=default)
 
 
-def one_of_from_json_schema(data: dict, definitions: Definitions) -> Field:
+def one_of_from_json_schema(
+    data: dict, default: typing.Any, definitions: Definitions
+) -> Field:
     one_of = [from_json_schema(item, definitions=definitions) for item in data["oneOf"]]
-    kwargs = {"one_of": one_of, "default": data.get("default", NO_DEFAULT)}
-    return OneOf(**kwargs)
+    return OneOf(one_of=one_of, default=default)
 
 
-def not_from_json_schema(data: dict, definitions: Definitions) -> Field:
+def not_from_json_schema(
+    data: dict, default: typing.Any, definitions: Definitions
+) -> Field:
     negated = from_json_schema(data["not"], definitions=definitions)
-    kwargs = {"negated": negated, "default": data.get("default", NO_DEFAULT)}
-    return Not(**kwargs)
+    return Not(negated=negated, default=default)
 
 
-def if_then_else_from_json_schema(data: dict, definitions: Definitions) -> Field:
+def if_then_else_from_json_schema(
+    data: dict, default: typing.Any, definitions: Definitions
+) -> Field:
     if_clause = from_json_schema(data["if"], definitions=definitions)
     then_clause = (
         from_json_schema(data["then"], definitions=definitions)
@@ -390,13 +650,397 @@ def if_then_else_from_json_schema(data: dict, definitions: Definitions) -> Field
         if "else" in data
         else None
     )
-    kwargs = {
-        "if_clause": if_clause,
-        "then_clause": then_clause,
-        "else_clause": else_clause,
-        "default": data.get("default", NO_DEFAULT),
+    return IfThenElse(
+        if_clause=if_clause,
+        then_clause=then_clause,
+        else_clause=else_clause,
+        default=default,
+    )
+
+
+COMPILABLE_CONSTRAINTS = frozenset(
+    {
+        "additionalProperties",
+        "const",
+        "default",
+        "description",
+        "enum",
+        "exclusiveMaximum",
+        "exclusiveMinimum",
+        "items",
+        "maxItems",
+        "maxLength",
+        "maxProperties",
+        "maximum",
+        "minItems",
+        "minLength",
+        "minProperties",
+        "minimum",
+        "multipleOf",
+        "pattern",
+        "properties",
+        "required",
+        "title",
+        "type",
     }
-    return IfThenElse(**kwargs)  # type: ignore
+)
+
+# The compiled keywords that hold a subschema.
+SUBSCHEMA_KEYS = frozenset({"additionalProperties", "items", "properties"})
+
+COMPILED_TYPES = {
+    "number": Float,
+    "integer": Integer,
+    "string": String,
+    "boolean": Boolean,
+    "array": Array,
+    "object": Object,
+}
+
+
+def compile_from_json_schema(
+    data: typing.Union[bool, dict],
+) -> typing.Callable[[typing.Any], typing.Any]:
+    """
+    Compile a JSON schema into a single specialized validation function.
+
+    Constraints that can be checked inline are emitted as straight-line Python
+    with the schema constants baked in. Any other subschema falls back to a
+    field built with `from_json_schema()`.
+
+    The returned function raises a `ValidationError` on the first failing
+    check, and otherwise returns the value unchanged.
+    """
+    definitions = Definitions()
+    if isinstance(data, dict):
+        for key, value in data.get("components", {}).get("schemas", {}).items():
+            ref = f"#/components/schemas/{key}"
+            definitions[ref] = from_json_schema(value, definitions=definitions)
+
+    return _SchemaCompiler(definitions=definitions).compile(data)
+
+
+class _SchemaCompiler:
+    """
+    Generates the source for `compile_from_json_schema()`, with one function
+    per subschema, and any non-literal constants bound into the namespace.
+    """
+
+    def __init__(self, definitions: Definitions) -> None:
+        self.definitions = definitions
+        self.functions: typing.List[str] = []
+        self.namespace: typing.Dict[str, typing.Any] = {
+            "Mapping": Mapping,
+            "Message": Message,
+            "ValidationError": ValidationError,
+            "isfinite": isfinite,
+        }
+
+    def compile(
+        self, data: typing.Union[bool, dict]
+    ) -> typing.Callable[[typing.Any], typing.Any]:
+        name = self.add_schema(data)
+        source = "\n\n".join(self.functions)
+        exec(compile(source, "<schema>", "exec"), self.namespace)
+        return self.namespace[name]
+
+    def add_constant(self, value: typing.Any) -> str:
+        name = f"_const_{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def add_schema(self, data: typing.Union[bool, dict]) -> str:
+        index = len(self.functions)
+        name = f"_validate_{index}"
+        # Reserve our slot before any nested subschemas are added.
+        self.functions.append("")
+        lines = [f"def {name}(value):"]
+        lines += ["    " + line for line in self.schema_lines(data)]
+        lines.append("    return value")
+        self.functions[index] = "\n".join(lines)
+        return name
+
+    def literal(self, value: typing.Any) -> str:
+        value_type = type(value)
+        if value_type is int or value_type is str:
+            return repr(value)
+        elif value_type is float and isfinite(value):
+            # The repr of `inf` or `nan` is not a valid expression.
+            return repr(value)
+        return self.add_constant(value)
+
+    def error(
+        self, field_class: typing.Type[Field], code: str, **kwargs: typing.Any
+    ) -> str:
+        text = field_class.errors[code].format(**kwargs)
+        return f"raise ValidationError(text={text!r}, code={code!r})"
+
+    def keyed_error(self, field_class: typing.Type[Field], code: str, key: str) -> str:
+        text = field_class.errors[code]
+        message = f"Message(text={text!r}, code={code!r}, key={key})"
+        return f"raise ValidationError(messages=[{message}])"
+
+    def fallback(self, data: typing.Union[bool, dict]) -> typing.List[str]:
+        field = from_json_schema(data, definitions=self.definitions)
+        return [f"{self.add_constant(field)}.validate(value)"]
+
+    def check_constraints(self, data: dict, type_string: str, allow_null: bool) -> None:
+        """
+        Build the typed field for the constraints, so that an unknown type or
+        an invalid constraint fails just as it does in `from_json_schema()`.
+        The subschemas are left out, since they're compiled separately.
+        """
+        constraints = {
+            key: value for key, value in data.items() if key not in SUBSCHEMA_KEYS
+        }
+        from_json_schema_type(
+            constraints,
+            type_string=type_string,
+            allow_null=allow_null,
+            default=data.get("default", NO_DEFAULT),
+            definitions=self.definitions,
+        )
+
+    def schema_lines(self, data: typing.Union[bool, dict]) -> typing.List[str]:
+        if isinstance(data, bool):
+            return [] if data else [self.error(NeverMatch, "never")]
+
+        if not COMPILABLE_CONSTRAINTS.issuperset(data) or isinstance(
+            data.get("items"), list
+        ):
+            return self.fallback(data)
+
+        lines = []
+        if not TYPE_CONSTRAINTS.isdisjoint(data):
+            type_strings, allow_null = get_valid_types(data)
+            if "type" not in data or len(type_strings) > 1:
+                # Untyped constraints or unions of several types.
+                return self.fallback(data)
+            elif not type_strings:
+                lines += [
+                    "if value is not None:",
+                    "    " + self.error(Const, "only_null"),
+                ]
+            else:
+                type_string = type_strings.pop()
+                self.check_constraints(data, type_string, allow_null)
+                field_class = COMPILED_TYPES[type_string]
+                type_lines = self.type_lines(data, type_string=type_string)
+                if allow_null:
+                    lines.append("if value is not None:")
+                    lines += ["    " + line for line in type_lines]
+                else:
+                    lines += [
+                        "if value is None:",
+                        "    " + self.error(field_class, "null"),
+                    ]
+                    lines += type_lines
+
+        if "enum" in data:
+            choices = self.add_constant(Uniqueness(data["enum"]))
+            lines += [
+                "if value is None:",
+                "    " + self.error(Choice, "null"),
+                f"if value not in {choices}:",
+                "    if value == '':",
+                "        " + self.error(Choice, "required"),
+                "    " + self.error(Choice, "choice"),
+            ]
+
+        if "const" in data:
+            const = data["const"]
+            code = "only_null" if const is None else "const"
+            lines += [
+                f"if value != {self.literal(const)}:",
+                "    " + self.error(Const, code, const=const),
+            ]
+
+        return lines
+
+    def type_lines(self, data: dict, type_string: str) -> typing.List[str]:
+        if type_string in ("number", "integer"):
+            return self.number_lines(data, integer=type_string == "integer")
+        elif type_string == "string":
+            return self.string_lines(data)
+        elif type_string == "boolean":
+            return [
+                "if value is not True and value is not False:",
+                "    " + self.error(Boolean, "type"),
+            ]
+        elif type_string == "array":
+            return self.array_lines(data)
+        return self.object_lines(data)
+
+    def number_lines(self, data: dict, integer: bool) -> typing.List[str]:
+        lines = [
+            "if isinstance(value, bool) or not isinstance(value, (int, float)):",
+            "    " + self.error(Number, "type"),
+        ]
+        if integer:
+            lines += [
+                "if isinstance(value, float) and not value.is_integer():",
+                "    " + self.error(Number, "integer"),
+            ]
+        else:
+            lines += [
+                "if isinstance(value, float) and not isfinite(value):",
+                "    " + self.error(Number, "finite"),
+            ]
+
+        checks = [
+            ("minimum", "<", "minimum"),
+            ("exclusiveMinimum", "<=", "exclusive_minimum"),
+            ("maximum", ">", "maximum"),
+            ("exclusiveMaximum", ">=", "exclusive_maximum"),
+        ]
+        for key, operator, code in checks:
+            if key in data:
+                bound = data[key]
+                lines += [
+                    f"if value {operator} {self.literal(bound)}:",
+                    "    " + self.error(Number, code, **{code: bound}),
+                ]
+
+        if "multipleOf" in data:
+            multiple_of = data["multipleOf"]
+            if isinstance(multiple_of, int):
+                test = f"value % {self.literal(multiple_of)}"
+            else:
+                test = f"not (value * {self.literal(1 / multiple_of)}).is_integer()"
+            lines += [
+                f"if {test}:",
+                "    " + self.error(Number, "multiple_of", multiple_of=multiple_of),
+            ]
+        return lines
+
+    def string_lines(self, data: dict) -> typing.List[str]:
+        lines = ["if not isinstance(value, str):", "    " + self.error(String, "type")]
+        min_length = data.get("minLength", 0)
+        max_length = data.get("maxLength")
+        pattern = data.get("pattern")
+        if min_length == 0 and max_length is None and pattern is None:
+            return lines
+
+        # Constraints are checked against the same normalized text as `String`.
+        lines.append("text = value.replace('\\0', '').strip()")
+        if min_length != 0:
+            lines += ["if not text:", "    " + self.error(String, "blank")]
+        if min_length > 1:
+            lines += [
+                f"if len(text) < {min_length!r}:",
+                "    " + self.error(String, "min_length", min_length=min_length),
+            ]
+        if max_length is not None:
+            lines += [
+                f"if len(text) > {max_length!r}:",
+                "    " + self.error(String, "max_length", max_length=max_length),
+            ]
+        if pattern is not None:
+            regex = self.add_constant(re.compile(pattern))
+            lines += [
+                f"if not {regex}.search(text):",
+                "    " + self.error(String, "pattern", pattern=pattern),
+            ]
+        return lines
+
+    def array_lines(self, data: dict) -> typing.List[str]:
+        items = data.get("items")
+        lines = ["if not isinstance(value, list):", "    " + self.error(Array, "type")]
+        min_items = data.get("minItems", 0)
+        max_items = data.get("maxItems")
+        if max_items is not None and min_items == max_items:
+            lines += [
+                f"if len(value) != {min_items!r}:",
+                "    " + self.error(Array, "exact_items", min_items=min_items),
+            ]
+        if min_items:
+            code = "empty" if min_items == 1 else "min_items"
+            lines += [
+                f"if len(value) < {min_items!r}:",
+                "    " + self.error(Array, code, min_items=min_items),
+            ]
+        if max_items is not None:
+            lines += [
+                f"if len(value) > {max_items!r}:",
+                "    " + self.error(Array, "max_items", max_items=max_items),
+            ]
+        if items is not None and items is not True:
+            validate_item = self.add_schema(items)
+            lines += [
+                "for index, item in enumerate(value):",
+                "    try:",
+                f"        {validate_item}(item)",
+                "    except ValidationError as exc:",
+                "        raise ValidationError(",
+                "            messages=exc.messages(add_prefix=index)",
+                "        ) from None",
+            ]
+        return lines
+
+    def object_lines(self, data: dict) -> typing.List[str]:
+        lines = [
+            "if type(value) is not dict and not isinstance(value, Mapping):",
+            "    " + self.error(Object, "type"),
+            "for key in value:",
+            "    if not isinstance(key, str):",
+            "        " + self.keyed_error(Object, "invalid_key", key="key"),
+        ]
+
+        min_properties = data.get("minProperties")
+        max_properties = data.get("maxProperties")
+        if min_properties is not None:
+            code = "empty" if min_properties == 1 else "min_properties"
+            lines += [
+                f"if len(value) < {min_properties!r}:",
+                "    " + self.error(Object, code, min_properties=min_properties),
+            ]
+        if max_properties is not None:
+            lines += [
+                f"if len(value) > {max_properties!r}:",
+                "    "
+                + self.error(Object, "max_properties", max_properties=max_properties),
+            ]
+
+        for key in data.get("required", []):
+            lines += [
+                f"if {key!r} not in value:",
+                "    " + self.keyed_error(Object, "required", key=repr(key)),
+            ]
+
+        properties = data.get("properties", {})
+        for key, child in properties.items():
+            validate_child = self.add_schema(child)
+            lines += [
+                f"if {key!r} in value:",
+                "    try:",
+                f"        {validate_child}(value[{key!r}])",
+                "    except ValidationError as exc:",
+                "        raise ValidationError(",
+                f"            messages=exc.messages(add_prefix={key!r})",
+                "        ) from None",
+            ]
+
+        additional_properties = data.get("additionalProperties", True)
+        known_keys = self.add_constant(frozenset(properties))
+        if additional_properties is False:
+            lines += [
+                "for key in value:",
+                f"    if key not in {known_keys}:",
+                "        " + self.keyed_error(Object, "invalid_property", key="key"),
+            ]
+        elif additional_properties is not True:
+            validate_child = self.add_schema(additional_properties)
+            lines += [
+                "for key, item in value.items():",
+                f"    if key not in {known_keys}:",
+                "        try:",
+                f"            {validate_child}(item)",
+                "        except ValidationError as exc:",
+                "            raise ValidationError(",
+                "                messages=exc.messages(add_prefix=key)",
+                "            ) from None",
+            ]
+        return lines
 
 
 def to_json_schema(
@@ -408,176 +1052,244 @@ def to_json_schema(
     elif isinstance(arg, NeverMatch):
         return False
 
-    field: typing.Optional[Field]
     data: dict = {}
     is_root = _definitions is None
     definitions = {} if _definitions is None else _definitions
 
     if isinstance(arg, Field):
-        field = arg
+        serializer = get_serializer(type(arg))
+        if serializer is None:
+            name = type(arg).__qualname__
+            raise ValueError(f"Cannot convert field type {name!r} to JSON Schema")
+        data = serializer(arg, definitions)
     elif isinstance(arg, Definitions):
-        field = None
         for key, value in arg.items():
             definitions[key] = to_json_schema(value, _definitions=definitions)
 
-    if isinstance(field, Reference):
-        data["$ref"] = f"#/components/schemas/{field.to}"
-        definitions[field.to] = to_json_schema(field.target, _definitions=definitions)
-
-    elif isinstance(field, String):
-        data["type"] = ["string", "null"] if field.allow_null else "string"
-        data.update(get_standard_properties(field))
-        if field.min_length is not None or not field.allow_blank:
-            data["minLength"] = field.min_length or 1
-        if field.max_length is not None:
-            data["maxLength"] = field.max_length
-        if field.pattern_regex is not None:
-            if field.pattern_regex.flags != re.RegexFlag.UNICODE:
-                flags = re.RegexFlag(field.pattern_regex.flags)
-                raise ValueError(
-                    "Cannot convert regular expression with non-standard flags "
-                    f"to JSON schema: {flags!s}"
-                )
-            data["pattern"] = field.pattern_regex.pattern
-        if field.format is not None:
-            data["format"] = field.format
-
-    elif isinstance(field, (Integer, Float, Decimal)):
-        base_type = "integer" if isinstance(field, Integer) else "number"
-        data["type"] = [base_type, "null"] if field.allow_null else base_type
-        data.update(get_standard_properties(field))
-        if field.minimum is not None:
-            data["minimum"] = field.minimum
-        if field.maximum is not None:
-            data["maximum"] = field.maximum
-        if field.exclusive_minimum is not None:
-            data["exclusiveMinimum"] = field.exclusive_minimum
-        if field.exclusive_maximum is not None:
-            data["exclusiveMaximum"] = field.exclusive_maximum
-        if field.multiple_of is not None:
-            data["multipleOf"] = field.multiple_of
-
-    elif isinstance(field, Boolean):
-        data["type"] = ["boolean", "null"] if field.allow_null else "boolean"
-        data.update(get_standard_properties(field))
-
-    elif isinstance(field, Array):
-        data["type"] = ["array", "null"] if field.allow_null else "array"
-        data.update(get_standard_properties(field))
-        if field.min_items is not None:
-            data["minItems"] = field.min_items
-        if field.max_items is not None:
-            data["maxItems"] = field.max_items
-        if field.items is not None:
-            if isinstance(field.items, (list, tuple)):
-                data["items"] = [
-                    to_json_schema(item, _definitions=definitions)
-                    for item in field.items
-                ]
-            else:
-                data["items"] = to_json_schema(field.items, _definitions=definitions)
-        if field.additional_items is not None:
-            if isinstance(field.additional_items, bool):
-                data["additionalItems"] = field.additional_items
-            else:
-                data["additionalItems"] = to_json_schema(
-                    field.additional_items, _definitions=definitions
-                )
-        if field.unique_items is not False:
-            data["uniqueItems"] = True
-
-    elif isinstance(field, Object):
-        data["type"] = ["object", "null"] if field.allow_null else "object"
-        data.update(get_standard_properties(field))
-        if field.properties:
-            data["properties"] = {
-                key: to_json_schema(value, _definitions=definitions)
-                for key, value in field.properties.items()
-            }
-        if field.pattern_properties:
-            data["patternProperties"] = {
-                key: to_json_schema(value, _definitions=definitions)
-                for key, value in field.pattern_properties.items()
-            }
-        if field.additional_properties is not None:
-            if isinstance(field.additional_properties, bool):
-                data["additionalProperties"] = field.additional_properties
-            else:
-                data["additionalProperties"] = to_json_schema(
-                    field.additional_properties, _definitions=definitions
-                )
-        if field.property_names is not None:
-            data["propertyNames"] = to_json_schema(
-                field.property_names, _definitions=definitions
+    if is_root and definitions:
+        data["components"] = {}
+        data["components"]["schemas"] = definitions
+    return data
+
+
+def get_serializer(field_class: type) -> typing.Optional[typing.Callable]:
+    serializer = TYPE_SERIALIZERS.get(field_class)
+    if serializer is None:
+        # Subclasses such as `Date` or `Email` resolve through their MRO once,
+        # and are then dispatched directly.
+        for base in field_class.__mro__[1:]:
+            serializer = TYPE_SERIALIZERS.get(base)
+            if serializer is not None:
+                TYPE_SERIALIZERS[field_class] = serializer
+                break
+    return serializer
+
+
+def reference_to_json_schema(field: Reference, definitions: dict) -> dict:
+    definitions[field.to] = to_json_schema(field.target, _definitions=definitions)
+    return {"$ref": f"#/components/schemas/{field.to}"}
+
+
+def string_to_json_schema(field: String, definitions: dict) -> dict:
+    data: dict = {}
+    data["type"] = ["string", "null"] if field.allow_null else "string"
+    set_standard_properties(data, field)
+    if field.min_length is not None or not field.allow_blank:
+        data["minLength"] = field.min_length or 1
+    if field.max_length is not None:
+        data["maxLength"] = field.max_length
+    if field.pattern_regex is not None:
+        if field.pattern_regex.flags != UNICODE_FLAGS:
+            flags = re.RegexFlag(field.pattern_regex.flags)
+            raise ValueError(
+                "Cannot convert regular expression with non-standard flags "
+                f"to JSON schema: {flags!s}"
             )
-        if field.max_properties is not None:
-            data["maxProperties"] = field.max_properties
-        if field.min_properties is not None:
-            data["minProperties"] = field.min_properties
-        if field.required:
-            data["required"] = field.required
-
-    elif isinstance(field, Schema):
-        data["type"] = ["object", "null"] if field.allow_null else "object"
-        data.update(get_standard_properties(field))
-        if field.fields:
-            data["properties"] = {
-                key: to_json_schema(value, _definitions=definitions)
-                for key, value in field.fields.items()
-            }
-        if field.required:
-            data["required"] = field.required
-
-    elif isinstance(field, Choice):
-        data["enum"] = [key for key, value in field.choices]
-        data.update(get_standard_properties(field))
-
-    elif isinstance(field, Const):
-        data["const"] = field.const
-        data.update(get_standard_properties(field))
-
-    elif isinstance(field, Union):
-        data["anyOf"] = [
-            to_json_schema(item, _definitions=definitions) for item in field.any_of
-        ]
-        data.update(get_standard_properties(field))
+        data["pattern"] = field.pattern_regex.pattern
+    if field.format is not None:
+        data["format"] = field.format
+    return data
 
-    elif isinstance(field, OneOf):
-        data["oneOf"] = [
-            to_json_schema(item, _definitions=definitions) for item in field.one_of
-        ]
-        data.update(get_standard_properties(field))
 
-    elif isinstance(field, AllOf):
-        data["allOf"] = [
-            to_json_schema(item, _definitions=definitions) for item in field.all_of
-        ]
-        data.update(get_standard_properties(field))
+def numeric_to_json_schema(field: Number, definitions: dict) -> dict:
+    data: dict = {}
+    base_type = "integer" if isinstance(field, Integer) else "number"
+    data["type"] = [base_type, "null"] if field.allow_null else base_type
+    set_standard_properties(data, field)
+    if field.minimum is not None:
+        data["minimum"] = field.minimum
+    if field.maximum is not None:
+        data["maximum"] = field.maximum
+    if field.exclusive_minimum is not None:
+        data["exclusiveMinimum"] = field.exclusive_minimum
+    if field.exclusive_maximum is not None:
+        data["exclusiveMaximum"] = field.exclusive_maximum
+    if field.multiple_of is not None:
+        data["multipleOf"] = field.multiple_of
+    return data
 
-    elif isinstance(field, IfThenElse):
-        data["if"] = to_json_schema(field.if_clause, _definitions=definitions)
-        if field.then_clause is not None:
-            data["then"] = to_json_schema(field.then_clause, _definitions=definitions)
-        if field.else_clause is not None:
-            data["else"] = to_json_schema(field.else_clause, _definitions=definitions)
-        data.update(get_standard_properties(field))
 
-    elif isinstance(field, Not):
-        data["not"] = to_json_schema(field.negated, _definitions=definitions)
-        data.update(get_standard_properties(field))
+def boolean_to_json_schema(field: Boolean, definitions: dict) -> dict:
+    data: dict = {}
+    data["type"] = ["boolean", "null"] if field.allow_null else "boolean"
+    set_standard_properties(data, field)
+    return data
 
-    elif field is not None:
-        name = type(field).__qualname__
-        raise ValueError(f"Cannot convert field type {name!r} to JSON Schema")
 
-    if is_root and definitions:
-        data["components"] = {}
-        data["components"]["schemas"] = definitions
+def array_to_json_schema(field: Array, definitions: dict) -> dict:
+    data: dict = {}
+    data["type"] = ["array", "null"] if field.allow_null else "array"
+    set_standard_properties(data, field)
+    if field.min_items is not None:
+        data["minItems"] = field.min_items
+    if field.max_items is not None:
+        data["maxItems"] = field.max_items
+    if field.items is not None:
+        if isinstance(field.items, (list, tuple)):
+            data["items"] = [
+                to_json_schema(item, _definitions=definitions) for item in field.items
+            ]
+        else:
+            data["items"] = to_json_schema(field.items, _definitions=definitions)
+    if field.additional_items is not None:
+        if isinstance(field.additional_items, bool):
+            data["additionalItems"] = field.additional_items
+        else:
+            data["additionalItems"] = to_json_schema(
+                field.additional_items, _definitions=definitions
+            )
+    if field.unique_items is not False:
+        data["uniqueItems"] = True
+    return data
+
+
+def object_to_json_schema(field: Object, definitions: dict) -> dict:
+    data: dict = {}
+    data["type"] = ["object", "null"] if field.allow_null else "object"
+    set_standard_properties(data, field)
+    if field.properties:
+        data["properties"] = {
+            key: to_json_schema(value, _definitions=definitions)
+            for key, value in field.properties.items()
+        }
+    if field.pattern_properties:
+        data["patternProperties"] = {
+            key: to_json_schema(value, _definitions=definitions)
+            for key, value in field.pattern_properties.items()
+        }
+    if field.additional_properties is not None:
+        if isinstance(field.additional_properties, bool):
+            data["additionalProperties"] = field.additional_properties
+        else:
+            data["additionalProperties"] = to_json_schema(
+                field.additional_properties, _definitions=definitions
+            )
+    if field.property_names is not None:
+        data["propertyNames"] = to_json_schema(
+            field.property_names, _definitions=definitions
+        )
+    if field.max_properties is not None:
+        data["maxProperties"] = field.max_properties
+    if field.min_properties is not None:
+        data["minProperties"] = field.min_properties
+    if field.required:
+        data["required"] = field.required
     return data
 
 
-def get_standard_properties(field: Field) -> dict:
-    data = {}
+def schema_to_json_schema(field: Schema, definitions: dict) -> dict:
+    data: dict = {}
+    data["type"] = ["object", "null"] if field.allow_null else "object"
+    set_standard_properties(data, field)
+    if field.fields:
+        data["properties"] = {
+            key: to_json_schema(value, _definitions=definitions)
+            for key, value in field.fields.items()
+        }
+    if field.required:
+        data["required"] = field.required
+    return data
+
+
+def choice_to_json_schema(field: Choice, definitions: dict) -> dict:
+    data: dict = {}
+    data["enum"] = [key for key, value in field.choices]
+    set_standard_properties(data, field)
+    return data
+
+
+def const_to_json_schema(field: Const, definitions: dict) -> dict:
+    data: dict = {}
+    data["const"] = field.const
+    set_standard_properties(data, field)
+    return data
+
+
+def union_to_json_schema(field: Union, definitions: dict) -> dict:
+    data: dict = {}
+    data["anyOf"] = [
+        to_json_schema(item, _definitions=definitions) for item in field.any_of
+    ]
+    set_standard_properties(data, field)
+    return data
+
+
+def one_of_to_json_schema(field: OneOf, definitions: dict) -> dict:
+    data: dict = {}
+    data["oneOf"] = [
+        to_json_schema(item, _definitions=definitions) for item in field.one_of
+    ]
+    set_standard_properties(data, field)
+    return data
+
+
+def all_of_to_json_schema(field: AllOf, definitions: dict) -> dict:
+    data: dict = {}
+    data["allOf"] = [
+        to_json_schema(item, _definitions=definitions) for item in field.all_of
+    ]
+    set_standard_properties(data, field)
+    return data
+
+
+def if_then_else_to_json_schema(field: IfThenElse, definitions: dict) -> dict:
+    data: dict = {}
+    data["if"] = to_json_schema(field.if_clause, _definitions=definitions)
+    if field.then_clause is not None:
+        data["then"] = to_json_schema(field.then_clause, _definitions=definitions)
+    if field.else_clause is not None:
+        data["else"] = to_json_schema(field.else_clause, _definitions=definitions)
+    set_standard_properties(data, field)
+    return data
+
+
+def not_to_json_schema(field: Not, definitions: dict) -> dict:
+    data: dict = {}
+    data["not"] = to_json_schema(field.negated, _definitions=definitions)
+    set_standard_properties(data, field)
+    return data
+
+
+TYPE_SERIALIZERS: typing.Dict[type, typing.Callable[..., dict]] = {
+    Reference: reference_to_json_schema,
+    String: string_to_json_schema,
+    Integer: numeric_to_json_schema,
+    Float: numeric_to_json_schema,
+    Decimal: numeric_to_json_schema,
+    Boolean: boolean_to_json_schema,
+    Array: array_to_json_schema,
+    Object: object_to_json_schema,
+    Schema: schema_to_json_schema,
+    Choice: choice_to_json_schema,
+    Const: const_to_json_schema,
+    Union: union_to_json_schema,
+    OneOf: one_of_to_json_schema,
+    AllOf: all_of_to_json_schema,
+    IfThenElse: if_then_else_to_json_schema,
+    Not: not_to_json_schema,
+}
+
+
+def set_standard_properties(data: dict, field: Field) -> None:
     if field.has_default():
         data["default"] = field.default
-    return data
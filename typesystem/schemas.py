@@ -1,8 +1,8 @@
 import typing
-from collections.abc import MutableMapping
+from collections.abc import Mapping, MutableMapping
 
 from typesystem.base import ValidationError
-from typesystem.fields import Field, Message
+from typesystem.fields import MISSING, Field, Message
 
 
 class Schema(Field):
@@ -25,13 +25,25 @@ class Schema(Field):
             for key, field in fields.items()
             if not (field.read_only or field.has_default())
         ]
+        # Read-only fields are skipped by `validate()`, so filter them out once,
+        # and bind what the validation loop needs from each of the others.
+        self._validators = [
+            (
+                key,
+                field.validate_or_error,
+                field.get_default_value if field.has_default() else None,
+            )
+            for key, field in fields.items()
+            if not field.read_only
+        ]
+        self._serializers = [(key, field.serialize) for key, field in fields.items()]
 
     def validate(self, value: typing.Any) -> typing.Any:
         if value is None and self.allow_null:
             return None
         elif value is None:
             raise self.validation_error("null")
-        elif not isinstance(value, (dict, typing.Mapping)):
+        elif type(value) is not dict and not isinstance(value, Mapping):
             raise self.validation_error("type")
 
         validated = {}
@@ -52,16 +64,13 @@ class Schema(Field):
                 error_messages.append(message)
 
         # Properties
-        for key, child_schema in self.fields.items():
-            if child_schema.read_only:
-                continue
-
-            if key not in value:
-                if child_schema.has_default():
-                    validated[key] = child_schema.get_default_value()
+        for key, validate_or_error, get_default_value in self._validators:
+            item = value.get(key, MISSING)
+            if item is MISSING:
+                if get_default_value is not None:
+                    validated[key] = get_default_value()
                 continue
-            item = value[key]
-            child_value, error = child_schema.validate_or_error(item)
+            child_value, error = validate_or_error(item)
             if not error:
                 validated[key] = child_value
             else:
@@ -81,16 +90,19 @@ class Schema(Field):
         is_mapping = isinstance(obj, dict)
 
         ret = {}
-        for key, field in self.fields.items():
+        for key, serialize in self._serializers:
             try:
                 value = obj[key] if is_mapping else getattr(obj, key)
             except (KeyError, AttributeError):
                 continue
-            ret[key] = field.serialize(value)
+            ret[key] = serialize(value)
         return ret
 
 
 class Definitions(MutableMapping):
+    # Instances stay weakly referenceable, as they were without slots.
+    __slots__ = ("_definitions", "__weakref__")
+
     def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
         self._definitions = dict(*args, **kwargs)  # type: dict
 
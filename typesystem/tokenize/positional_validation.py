@@ -12,25 +12,42 @@ def validate_with_positions(
     try:
         return validator.validate(token.value)
     except ValidationError as error:
+        # Messages frequently share a path prefix, so resolve each token from
+        # its already-resolved parent rather than walking down from the root.
+        tokens: typing.Dict[tuple, Token] = {(): token}
+
+        def lookup(index: list) -> Token:
+            path = tuple(index)
+            try:
+                return tokens[path]
+            except KeyError:
+                child = lookup(index[:-1])._get_child_token(index[-1])
+                tokens[path] = child
+                return child
+
         messages = []
+        char_indices = []
         for message in error.messages():
             if message.code == "required":
                 field = message.index[-1]
-                token = token.lookup(message.index[:-1])
+                message_token = lookup(message.index[:-1])
                 text = f"The field {field!r} is required."
             else:
-                token = token.lookup(message.index)
+                message_token = lookup(message.index)
                 text = message.text
 
+            start_position = message_token.start
             positional_message = Message(
                 text=text,
                 code=message.code,
                 index=message.index,
-                start_position=token.start,
-                end_position=token.end,
+                start_position=start_position,
+                end_position=message_token.end,
             )
             messages.append(positional_message)
-        messages = sorted(
-            messages, key=lambda m: m.start_position.char_index  # type: ignore
-        )
-        raise ValidationError(messages=messages)
+            char_indices.append(start_position.char_index)
+
+        # Sort on the plain integer offsets, rather than reaching through
+        # each message to its position on every comparison.
+        order = sorted(range(len(messages)), key=char_indices.__getitem__)
+        raise ValidationError(messages=[messages[idx] for idx in order])
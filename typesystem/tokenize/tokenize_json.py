@@ -6,7 +6,13 @@ from typesystem.base import ParseError, Position
 from typesystem.fields import Field
 from typesystem.schemas import Schema
 from typesystem.tokenize.positional_validation import validate_with_positions
-from typesystem.tokenize.tokens import DictToken, ListToken, ScalarToken, Token
+from typesystem.tokenize.tokens import (
+    DictToken,
+    LineBreaks,
+    ListToken,
+    ScalarToken,
+    Token,
+)
 
 FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
 WHITESPACE = re.compile(r"[ \t\n\r]*", FLAGS)
@@ -23,6 +29,7 @@ def _TokenizingJSONObject(
     scan_once: typing.Callable[[str, int], typing.Tuple[Token, int]],
     memo: dict,
     content: str,
+    line_breaks: LineBreaks,
     _w: typing.Callable = WHITESPACE.match,
     _ws: str = WHITESPACE_STR,
 ) -> typing.Tuple[dict, int]:
@@ -49,8 +56,7 @@ def _TokenizingJSONObject(
     while True:
         start = end - 1
         key, end = scanstring(s, end, strict)
-        key = memo_get(key, key)
-        key = ScalarToken(memo_get(key, key), start, end - 1, content)
+        key = ScalarToken(memo_get(key, key), start, end - 1, content, line_breaks)
         # To skip some function call overhead we optimize the fast paths where
         # the JSON key separator is ": " or just ":".
         if s[end : end + 1] != ":":
@@ -85,8 +91,15 @@ def _TokenizingJSONObject(
             break
         elif nextchar != ",":
             raise JSONDecodeError("Expecting ',' delimiter", s, end - 1)
-        end = _w(s, end).end()
+        # As above, optimize for a separator of ", " or just "," before
+        # falling back to the regex for longer runs of whitespace.
         nextchar = s[end : end + 1]
+        if nextchar and nextchar in _ws:
+            end += 1
+            nextchar = s[end : end + 1]
+            if nextchar and nextchar in _ws:
+                end = _w(s, end + 1).end()
+                nextchar = s[end : end + 1]
         end += 1
         if nextchar != '"':
             raise JSONDecodeError(
@@ -98,6 +111,7 @@ def _TokenizingJSONObject(
 def _make_scanner(
     context: typing.Any, content: str
 ) -> typing.Callable[[str, int], typing.Tuple[Token, int]]:
+    line_breaks = LineBreaks(content)
     parse_object = _TokenizingJSONObject
     parse_array = context.parse_array
     parse_string = context.parse_string
@@ -115,34 +129,35 @@ def _make_scanner(
 
         if nextchar == '"':
             value, end = parse_string(string, idx + 1, strict)
-            return ScalarToken(value, idx, end - 1, content), end
+            return ScalarToken(value, idx, end - 1, content, line_breaks), end
         elif nextchar == "{":
             value, end = parse_object(
-                (string, idx + 1), strict, _scan_once, memo, content
+                (string, idx + 1), strict, _scan_once, memo, content, line_breaks
             )
-            return DictToken(value, idx, end - 1, content), end
+            return DictToken(value, idx, end - 1, content, line_breaks), end
         elif nextchar == "[":
             value, end = parse_array((string, idx + 1), _scan_once)
-            return ListToken(value, idx, end - 1, content), end
+            return ListToken(value, idx, end - 1, content, line_breaks), end
         elif nextchar == "n" and string[idx : idx + 4] == "null":
             value, end = None, idx + 4
-            return ScalarToken(value, idx, end - 1, content), end
+            return ScalarToken(value, idx, end - 1, content, line_breaks), end
         elif nextchar == "t" and string[idx : idx + 4] == "true":
             value, end = True, idx + 4
-            return ScalarToken(value, idx, end - 1, content), end
+            return ScalarToken(value, idx, end - 1, content, line_breaks), end
         elif nextchar == "f" and string[idx : idx + 5] == "false":
             value, end = False, idx + 5
-            return ScalarToken(value, idx, end - 1, content), end
+            return ScalarToken(value, idx, end - 1, content, line_breaks), end
 
         m = match_number(string, idx)
         if m is not None:
             integer, frac, exp = m.groups()
             if frac or exp:
-                res = parse_float(integer + (frac or "") + (exp or ""))
+                # The full match is the concatenation of all three groups.
+                res = parse_float(m.group())
             else:
                 res = parse_int(integer)
             value, end = res, m.end()
-            return ScalarToken(value, idx, end - 1, content), end
+            return ScalarToken(value, idx, end - 1, content, line_breaks), end
         else:  # pragma: no cover
             raise StopIteration(idx)
 
@@ -166,7 +181,8 @@ def tokenize_json(content: typing.Union[str, bytes]) -> Token:
     if isinstance(content, bytes):
         content = content.decode("utf-8", "ignore")
 
-    if not content.strip():
+    # Unlike strip(), isspace() checks for blank content without copying it.
+    if not content or content.isspace():
         # Handle the empty string case explicitly for clear error messaging.
         position = Position(column_no=1, line_no=1, char_index=0)
         raise ParseError(text="No content.", code="no_content", position=position)
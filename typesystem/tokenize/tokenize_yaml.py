@@ -5,13 +5,25 @@ except ImportError:  # pragma: no cover
     yaml = None  # type: ignore
     SafeLoader = None  # type: ignore
 
+try:
+    # Use the libyaml backed loader when pyyaml has been built with it.
+    from yaml import CSafeLoader as BaseLoader
+except ImportError:  # pragma: no cover
+    BaseLoader = SafeLoader  # type: ignore
+
 import typing
 
 from typesystem.base import ParseError, Position
 from typesystem.fields import Field
 from typesystem.schemas import Schema
 from typesystem.tokenize.positional_validation import validate_with_positions
-from typesystem.tokenize.tokens import DictToken, ListToken, ScalarToken, Token
+from typesystem.tokenize.tokens import (
+    DictToken,
+    LineBreaks,
+    ListToken,
+    ScalarToken,
+    Token,
+)
 
 
 def _get_position(content: str, index: int) -> Position:
@@ -22,63 +34,65 @@ def _get_position(content: str, index: int) -> Position:
     )
 
 
-def tokenize_yaml(content: typing.Union[str, bytes]) -> Token:
-    assert yaml is not None, "'pyyaml' must be installed."
+def construct_mapping(loader: "yaml.Loader", node: "yaml.Node") -> DictToken:
+    start = node.start_mark.index
+    end = node.end_mark.index
+    mapping = loader.construct_mapping(node)
+    return DictToken(mapping, start, end - 1, loader.content, loader.line_breaks)
 
-    if isinstance(content, bytes):
-        str_content = content.decode("utf-8", "ignore")
-    else:
-        str_content = content
 
-    if not str_content.strip():
-        # Handle the empty string case explicitly for clear error messaging.
-        position = Position(column_no=1, line_no=1, char_index=0)
-        raise ParseError(text="No content.", code="no_content", position=position)
+def construct_sequence(loader: "yaml.Loader", node: "yaml.Node") -> ListToken:
+    start = node.start_mark.index
+    end = node.end_mark.index
+    value = loader.construct_sequence(node)
+    return ListToken(value, start, end - 1, loader.content, loader.line_breaks)
+
+
+def construct_scalar(loader: "yaml.Loader", node: "yaml.Node") -> ScalarToken:
+    start = node.start_mark.index
+    end = node.end_mark.index
+    value = loader.construct_scalar(node)  # type: ignore
+    return ScalarToken(value, start, end - 1, loader.content, loader.line_breaks)
+
+
+def construct_int(loader: "yaml.Loader", node: "yaml.Node") -> ScalarToken:
+    start = node.start_mark.index
+    end = node.end_mark.index
+    value = loader.construct_yaml_int(node)
+    return ScalarToken(value, start, end - 1, loader.content, loader.line_breaks)
+
+
+def construct_float(loader: "yaml.Loader", node: "yaml.Node") -> ScalarToken:
+    start = node.start_mark.index
+    end = node.end_mark.index
+    value = loader.construct_yaml_float(node)
+    return ScalarToken(value, start, end - 1, loader.content, loader.line_breaks)
+
+
+def construct_bool(loader: "yaml.Loader", node: "yaml.Node") -> ScalarToken:
+    start = node.start_mark.index
+    end = node.end_mark.index
+    value = loader.construct_yaml_bool(node)
+    return ScalarToken(value, start, end - 1, loader.content, loader.line_breaks)
+
 
-    class CustomSafeLoader(SafeLoader):
-        pass
-
-    def construct_mapping(loader: "yaml.Loader", node: "yaml.Node") -> DictToken:
-        start = node.start_mark.index
-        end = node.end_mark.index
-        mapping = loader.construct_mapping(node)
-        return DictToken(mapping, start, end - 1, content=str_content)
-
-    def construct_sequence(loader: "yaml.Loader", node: "yaml.Node") -> ListToken:
-        start = node.start_mark.index
-        end = node.end_mark.index
-        value = loader.construct_sequence(node)
-        return ListToken(value, start, end - 1, content=str_content)
-
-    def construct_scalar(loader: "yaml.Loader", node: "yaml.Node") -> ScalarToken:
-        start = node.start_mark.index
-        end = node.end_mark.index
-        value = loader.construct_scalar(node)  # type: ignore
-        return ScalarToken(value, start, end - 1, content=str_content)
-
-    def construct_int(loader: "yaml.Loader", node: "yaml.Node") -> ScalarToken:
-        start = node.start_mark.index
-        end = node.end_mark.index
-        value = loader.construct_yaml_int(node)
-        return ScalarToken(value, start, end - 1, content=str_content)
-
-    def construct_float(loader: "yaml.Loader", node: "yaml.Node") -> ScalarToken:
-        start = node.start_mark.index
-        end = node.end_mark.index
-        value = loader.construct_yaml_float(node)
-        return ScalarToken(value, start, end - 1, content=str_content)
-
-    def construct_bool(loader: "yaml.Loader", node: "yaml.Node") -> ScalarToken:
-        start = node.start_mark.index
-        end = node.end_mark.index
-        value = loader.construct_yaml_bool(node)
-        return ScalarToken(value, start, end - 1, content=str_content)
-
-    def construct_null(loader: "yaml.Loader", node: "yaml.Node") -> ScalarToken:
-        start = node.start_mark.index
-        end = node.end_mark.index
-        value = loader.construct_yaml_null(node)
-        return ScalarToken(value, start, end - 1, content=str_content)
+def construct_null(loader: "yaml.Loader", node: "yaml.Node") -> ScalarToken:
+    start = node.start_mark.index
+    end = node.end_mark.index
+    value = loader.construct_yaml_null(node)
+    return ScalarToken(value, start, end - 1, loader.content, loader.line_breaks)
+
+
+def make_loader(base: typing.Type[SafeLoader]) -> typing.Type[SafeLoader]:
+    """
+    Return a loader class that constructs tokens rather than plain values.
+    """
+
+    class CustomSafeLoader(base):  # type: ignore
+        def __init__(self, stream: str) -> None:
+            super().__init__(stream)
+            self.content = stream
+            self.line_breaks = LineBreaks(stream)
 
     CustomSafeLoader.add_constructor(
         yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, construct_mapping
@@ -100,10 +114,39 @@ def tokenize_yaml(content: typing.Union[str, bytes]) -> Token:
 
     CustomSafeLoader.add_constructor("tag:yaml.org,2002:null", construct_null)
 
+    return CustomSafeLoader
+
+
+if yaml is not None:
+    TokenLoader = make_loader(BaseLoader)
+    # libyaml words its errors differently, so errors are reported the way
+    # the pure python loader would.
+    ErrorLoader = TokenLoader if BaseLoader is SafeLoader else make_loader(SafeLoader)
+
+
+def tokenize_yaml(content: typing.Union[str, bytes]) -> Token:
+    assert yaml is not None, "'pyyaml' must be installed."
+
+    if isinstance(content, bytes):
+        str_content = content.decode("utf-8", "ignore")
+    else:
+        str_content = content
+
+    # Unlike strip(), isspace() checks for blank content without copying it.
+    if not str_content or str_content.isspace():
+        # Handle the empty string case explicitly for clear error messaging.
+        position = Position(column_no=1, line_no=1, char_index=0)
+        raise ParseError(text="No content.", code="no_content", position=position)
+
     try:
-        return yaml.load(str_content, CustomSafeLoader)
+        return yaml.load(str_content, TokenLoader)
     except (yaml.scanner.ScannerError, yaml.parser.ParserError) as exc:  # type: ignore
         # Handle cases that result in a YAML parse error.
+        if ErrorLoader is not TokenLoader:
+            try:
+                yaml.load(str_content, ErrorLoader)
+            except (yaml.scanner.ScannerError, yaml.parser.ParserError) as err:
+                exc = err
         assert exc.problem is not None
         assert exc.problem_mark is not None
         text = exc.problem + "."
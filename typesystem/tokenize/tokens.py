@@ -1,16 +1,64 @@
+import re
 import typing
+from bisect import bisect_right
 
 from typesystem.base import Position
 
+# The same line boundaries that `str.splitlines()` recognises.
+LINE_BREAK = re.compile("\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+class LineBreaks:
+    """
+    The line break offsets within a document, shared by all of its tokens.
+
+    Breaks are the same as those of `str.splitlines()`, so "\\r\\n" counts as
+    one. The document is only scanned once a position is first looked up.
+    """
+
+    __slots__ = ("_content", "_starts", "_ends")
+
+    def __init__(self, content: str) -> None:
+        self._content = content
+        self._starts: typing.Optional[typing.List[int]] = None
+        self._ends: typing.List[int] = []
+
+    def get_offsets(self) -> typing.Tuple[typing.List[int], typing.List[int]]:
+        """
+        Return the start and end offsets of each line break, in order.
+        """
+        if self._starts is None:
+            matches = list(LINE_BREAK.finditer(self._content))
+            self._ends = [match.end() for match in matches]
+            self._starts = [match.start() for match in matches]
+        return self._starts, self._ends
+
 
 class Token:
+    # Documents can produce a great many tokens, so avoid a per-instance dict.
+    __slots__ = (
+        "_value",
+        "_start_index",
+        "_end_index",
+        "_content",
+        "_line_breaks",
+    )
+
     def __init__(
-        self, value: typing.Any, start_index: int, end_index: int, content: str = ""
+        self,
+        value: typing.Any,
+        start_index: int,
+        end_index: int,
+        content: str = "",
+        line_breaks: typing.Optional[LineBreaks] = None,
     ) -> None:
         self._value = value
         self._start_index = start_index
         self._end_index = end_index
         self._content = content
+        if line_breaks is None:
+            line_breaks = LineBreaks(content)
+        self._line_breaks = line_breaks
 
     def _get_value(self) -> typing.Any:
         raise NotImplementedError  # pragma: nocover
@@ -54,14 +102,30 @@ class Token:
         return token._get_key_token(index[-1])
 
     def _get_position(self, index: int) -> Position:
-        content = self._content[: index + 1]
-        lines = content.splitlines()
-        line_no = max(len(lines), 1)
-        column_no = 1 if not lines else max(len(lines[-1]), 1)
-        return Position(line_no, column_no, index)
+        char_index = min(index, len(self._content) - 1)
+        if char_index < 0:
+            return Position(1, 1, index)
+        starts, ends = self._line_breaks.get_offsets()
+        count = bisect_right(starts, char_index)
+        if count and char_index < ends[count - 1]:
+            # A line break is reported at the final column of the line it ends.
+            line_no = count
+            line_start = ends[count - 2] if count > 1 else 0
+            column_no = starts[count - 1] - line_start
+        else:
+            line_no = count + 1
+            line_start = ends[count - 1] if count else 0
+            column_no = char_index + 1 - line_start
+        return Position(line_no, max(column_no, 1), index)
 
     def __repr__(self) -> str:
-        return "%s(%s)" % (self.__class__.__name__, repr(self.string))
+        # Truncate long tokens, without slicing out the whole of their content.
+        if self._end_index - self._start_index >= 40:
+            start = self._start_index
+            string = self._content[start : start + 37] + "..."
+        else:
+            string = self.string
+        return "%s(%s)" % (self.__class__.__name__, repr(string))
 
     def __eq__(self, other: typing.Any) -> bool:
         return isinstance(other, Token) and (
@@ -72,6 +136,8 @@ class Token:
 
 
 class ScalarToken(Token):
+    __slots__ = ()
+
     def __hash__(self) -> typing.Any:
         return hash(self._value)
 
@@ -80,14 +146,23 @@ class ScalarToken(Token):
 
 
 class DictToken(Token):
+    __slots__ = ("_child_keys", "_child_tokens")
+
     def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
         super().__init__(*args, **kwargs)
-        self._child_keys = {k._value: k for k in self._value.keys()}
-        self._child_tokens = {k._value: v for k, v in self._value.items()}
+        child_keys = {}
+        child_tokens = {}
+        for key_token, value_token in self._value.items():
+            key = key_token._value
+            child_keys[key] = key_token
+            child_tokens[key] = value_token
+        self._child_keys = child_keys
+        self._child_tokens = child_tokens
 
     def _get_value(self) -> typing.Any:
+        # Key tokens are always scalars, so read their values directly.
         return {
-            key_token._get_value(): value_token._get_value()
+            key_token._value: value_token._get_value()
             for key_token, value_token in self._value.items()
         }
 
@@ -99,6 +174,8 @@ class DictToken(Token):
 
 
 class ListToken(Token):
+    __slots__ = ()
+
     def _get_value(self) -> typing.Any:
         return [token._get_value() for token in self._value]
 
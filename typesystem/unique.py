@@ -12,6 +12,10 @@ class Uniqueness:
     TRUE = object()
     FALSE = object()
 
+    # Values of these exact types are already uniquely hashable as they are.
+    # Note that `bool` is deliberately absent, since `type(True) is bool`.
+    HASHABLE_TYPES = frozenset({int, float, str, type(None)})
+
     def __init__(self, items: list = None) -> None:
         self._set: set = set()
         for item in items or []:
@@ -29,6 +33,8 @@ class Uniqueness:
         """
         Coerce a primitive into a uniquely hashable type, for uniqueness checks.
         """
+        if type(element) in self.HASHABLE_TYPES:
+            return element
 
         # Only primitive types can be handled.
         assert (element is None) or isinstance(